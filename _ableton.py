@@ -0,0 +1,47 @@
+from __future__ import absolute_import, print_function, unicode_literals
+
+# Ableton v3 framework names used across the script, resolved in one place: Live's
+# bundled ableton.v3, or a copy shipped inside this script's folder
+try:
+    from ableton.v3.control_surface import (
+        HIGH_PRIORITY,
+        MIDI_NOTE_TYPE,
+        Component,
+        ElementsBase,
+        create_matrix_identifiers
+    )
+    from ableton.v3.control_surface.components import (
+        NoteEditorComponent,
+        LoopSelectorComponent,
+        GridResolutionComponent,
+        DrumGroupComponent,
+        NoteEditorPaginator,
+        SequencerClip
+    )
+    from ableton.v3.control_surface.controls import ButtonControl, ToggleButtonControl
+    from ableton.v3.control_surface.midi import SYSEX_END, SYSEX_START
+    from ableton.v3.control_surface.mode import ImmediateBehaviour, MomentaryBehaviour, make_reenter_behaviour
+    from ableton.v3.base import depends, listenable_property, EventObject, inject, const, listens, task
+    from ableton.v3.live import liveobj_valid, get_bar_length, playing_clip_slot, scene_index
+except ImportError:
+    from .ableton.v3.control_surface import (
+        HIGH_PRIORITY,
+        MIDI_NOTE_TYPE,
+        Component,
+        ElementsBase,
+        create_matrix_identifiers
+    )
+    from .ableton.v3.control_surface.components import (
+        NoteEditorComponent,
+        LoopSelectorComponent,
+        GridResolutionComponent,
+        DrumGroupComponent,
+        NoteEditorPaginator,
+        SequencerClip
+    )
+    from .ableton.v3.control_surface.controls import ButtonControl, ToggleButtonControl
+    from .ableton.v3.control_surface.midi import SYSEX_END, SYSEX_START
+    from .ableton.v3.control_surface.mode import ImmediateBehaviour, MomentaryBehaviour, make_reenter_behaviour
+    from .ableton.v3.base import depends, listenable_property, EventObject, inject, const, listens, task
+    from .ableton.v3.live import liveobj_valid, get_bar_length, playing_clip_slot, scene_index
+
@@ -1,42 +1,46 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
+import logging
+import sys
+
+from ._ableton import (
+    Component,
+    NoteEditorComponent,
+    LoopSelectorComponent,
+    GridResolutionComponent,
+    DrumGroupComponent,
+    NoteEditorPaginator,
+    SequencerClip,
+    ButtonControl,
+    ToggleButtonControl,
+    depends,
+    listenable_property,
+    EventObject,
+    inject,
+    const,
+    listens,
+    task,
+    liveobj_valid,
+    get_bar_length,
+    playing_clip_slot,
+    scene_index,
+)
+
+from Live.Song import Quantization  # type: ignore
 try:
-    from ableton.v3.control_surface import Component
-    from ableton.v3.control_surface.components import (
-        NoteEditorComponent,
-        LoopSelectorComponent,
-        GridResolutionComponent,
-        DrumGroupComponent,
-        NoteEditorPaginator,
-        SequencerClip
-    )
-    from ableton.v3.control_surface.controls import ButtonControl, ToggleButtonControl
-    from ableton.v3.base import depends, listenable_property, EventObject, inject, const, listens
-    from ableton.v3.live import liveobj_valid, get_bar_length, playing_clip_slot, scene_index
     from Live.Clip import MidiNoteSpecification  # type: ignore
-    from Live.Song import Quantization  # type: ignore
 except ImportError:
-    from .ableton.v3.control_surface import Component
-    from .ableton.v3.control_surface.components import (
-        NoteEditorComponent,
-        LoopSelectorComponent,
-        GridResolutionComponent,
-        DrumGroupComponent,
-        NoteEditorPaginator,
-        SequencerClip
-    )
-    from .ableton.v3.control_surface.controls import ButtonControl, ToggleButtonControl
-    from .ableton.v3.base import depends, listenable_property, EventObject, inject, const, listens
-    from .ableton.v3.live import liveobj_valid, get_bar_length, playing_clip_slot, scene_index
-
-    from Live.Clip import MidiNoteSpecification  # type: ignore
-    from Live.Song import Quantization  # type: ignore
+    MidiNoteSpecification = None
 
 
 from .logger_config import get_logger
 
 logger = get_logger('drum_step_sequencer')
 
+# Evaluated once, so every debug site only tests a module constant. False when Python
+# runs optimized (-O / PYTHONOPTIMIZE) or when the logger is not at DEBUG level
+_DEBUG = __debug__ and logger.isEnabledFor(logging.DEBUG)
+
 # Constants for the 8x8 grid layout
 # Sequencer steps (top 4x8 = 32 steps for 2 bars of 16 steps)
 SEQUENCE_STEPS_WIDTH = 8
@@ -51,6 +55,47 @@ NORMAL_VELOCITY = 100
 SOFT_VELOCITY = 60
 ACCENT_VELOCITY = 127
 
+# Step colors
+_COLOR_ACCENT = sys.intern("NoteEditor.StepAccent")
+_COLOR_SOFT = sys.intern("NoteEditor.StepSoft")
+_COLOR_NORMAL = sys.intern("NoteEditor.StepNormal")
+_COLOR_DOUBLE_TIME = sys.intern("NoteEditor.StepDoubleTime")
+
+# Velocity button colors
+_C_ACCENT_ON = sys.intern("DrumStepSequencer.VelocityAccentOn")
+_C_ACCENT_OFF = sys.intern("DrumStepSequencer.VelocityAccentOff")
+_C_SOFT_ON = sys.intern("DrumStepSequencer.VelocitySoftOn")
+_C_SOFT_OFF = sys.intern("DrumStepSequencer.VelocitySoftOff")
+
+# Step color for each MIDI velocity (0-127)
+_VEL_COLOR = (
+    [_COLOR_SOFT] * (SOFT_VELOCITY + 1)
+    + [_COLOR_NORMAL] * (ACCENT_VELOCITY - SOFT_VELOCITY - 1)
+    + [_COLOR_ACCENT]
+)
+
+# Seconds to wait for further pad presses before selecting the last one
+PAD_SELECT_DELAY = 0.03
+
+# Ticks per quarter note used for loop length arithmetic
+PPQ = 96
+
+
+def to_ticks(time):
+    """Convert a time in beats to integer ticks"""
+    return int(round(time * PPQ))
+
+
+def from_ticks(ticks):
+    """Convert integer ticks back to a time in beats"""
+    return ticks / PPQ
+
+
+def _set_button_color(button, color):
+    """Set a button's color only if it differs, avoiding a redundant LED message"""
+    if button.color != color:
+        button.color = color
+
 
 class CustomVelocityProvider(EventObject):
     """
@@ -64,21 +109,24 @@ class CustomVelocityProvider(EventObject):
         self._accent_pressed = False
         self._soft_pressed = False
         self._current_velocity = NORMAL_VELOCITY
-        logger.debug(f"CustomVelocityProvider initialized with velocity: {self._current_velocity}")
+        if _DEBUG:
+            logger.debug("CustomVelocityProvider initialized with velocity: %s", self._current_velocity)
 
     def set_accent_pressed(self, pressed):
         """Set accent button state"""
         if self._accent_pressed != pressed:
             self._accent_pressed = pressed
             self._update_velocity()
-            logger.debug(f"Accent button {'pressed' if pressed else 'released'}, velocity: {self._current_velocity}")
+            if _DEBUG:
+                logger.debug("Accent %s velocity=%d", 'pressed' if pressed else 'released', self._current_velocity)
 
     def set_soft_pressed(self, pressed):
         """Set soft button state"""
         if self._soft_pressed != pressed:
             self._soft_pressed = pressed
             self._update_velocity()
-            logger.debug(f"Soft button {'pressed' if pressed else 'released'}, velocity: {self._current_velocity}")
+            if _DEBUG:
+                logger.debug("Soft %s velocity=%d", 'pressed' if pressed else 'released', self._current_velocity)
 
     def _update_velocity(self):
         """Update current velocity based on button states"""
@@ -109,17 +157,26 @@ class DrumPadPitchProvider(EventObject):
     def __init__(self, drum_group_component=None, *a, **k):
         super().__init__(*a, **k)
         self._drum_group = drum_group_component  # Can be None initially, set later
-        logger.info(f"DrumPadPitchProvider initialized with pitches: {self.pitches}")
+        # Single pitch currently held in pitches, or None when it holds a list of several
+        pitches = self.pitches
+        self._pitch_scalar = pitches[0] if len(pitches) == 1 else None
+        if _DEBUG:
+            logger.debug("DrumPadPitchProvider initialized with pitches: %s", self.pitches)
 
     def set_pitch(self, pitch):
         """Manually set the pitch to edit"""
         if isinstance(pitch, list):
             new_pitches = pitch
         else:
+            # Re-selecting the same pad is the common case, so skip building a new list
+            if pitch == self._pitch_scalar:
+                return
             new_pitches = [pitch]
 
         if new_pitches != self.pitches:
-            logger.debug(f"Pitch changed: {self.pitches} → {new_pitches}")
+            if _DEBUG:
+                logger.debug("Pitch changed: %s → %s", self.pitches, new_pitches)
+            self._pitch_scalar = new_pitches[0] if len(new_pitches) == 1 else None
             self.pitches = new_pitches  # Managed property automatically notifies listeners!
 
 
@@ -141,22 +198,32 @@ class CustomDrumGroupComponent(DrumGroupComponent):
         self._parent_sequencer = None  # Will be set by parent
         self._target_track = target_track
 
-        logger.debug(f"CustomDrumGroupComponent init: selection_only={selection_only}, pitch_provider={pitch_provider}")
+        if _DEBUG:
+            logger.debug("CustomDrumGroupComponent init: selection_only=%s, pitch_provider=%s", selection_only, pitch_provider)
+
+        self._bind_matrix_pressed_handler()
+
+        # Pad selection is applied on the trailing edge of a burst of presses
+        self._pending_pad = None
+        self._pending_note = None
+        self._pad_select_task = self._tasks.add(
+            task.sequence(task.wait(PAD_SELECT_DELAY), task.run(self._apply_pending_pad_select))
+        )
+        self._pad_select_task.kill()
 
-        # Listen to target track changes
-        if self._target_track:
-            self.register_slot(self._target_track, self._on_target_track_changed, "target_track")
-            logger.debug("CustomDrumGroup: Registered target track listener")
+        # Target track changes are forwarded by the parent DrumStepSequencerComponent
 
         # If in selection-only mode, always keep pads in listenable mode
         if self._selection_only:
             self._set_control_pads_from_script(True)
-            logger.debug("Set control pads from script (listenable mode)")
+            if _DEBUG:
+                logger.debug("Set control pads from script (listenable mode)")
 
     def set_parent_sequencer(self, parent_sequencer):
         """Set reference to parent DrumStepSequencerComponent for lock state checking"""
         self._parent_sequencer = parent_sequencer
-        logger.debug(f"CustomDrumGroup: Set parent sequencer reference: {parent_sequencer}")
+        if _DEBUG:
+            logger.debug("CustomDrumGroup: Set parent sequencer reference: %s", parent_sequencer)
 
     # Note: Lock functionality now handled by framework's TargetTrackComponent
 
@@ -169,9 +236,17 @@ class CustomDrumGroupComponent(DrumGroupComponent):
             self._set_control_pads_from_script(True)
             self._update_control_from_script()
 
+    @property
+    def selection_only(self):
+        """Whether pads only select drum pads instead of playing them"""
+        return self._selection_only
+
     def set_selection_only_mode(self, enabled):
         """Enable or disable selection-only mode"""
+        if self._selection_only == enabled:
+            return
         self._selection_only = enabled
+        self._bind_matrix_pressed_handler()
         if enabled:
             # Force pads into listenable mode (selection only)
             self._set_control_pads_from_script(True)
@@ -179,82 +254,111 @@ class CustomDrumGroupComponent(DrumGroupComponent):
             # Allow normal playable mode
             self._set_control_pads_from_script(False)
 
-    def _on_matrix_pressed(self, button):
-        """Override to handle selection-only mode and pitch tracking"""
-        logger.debug(f"_on_matrix_pressed called: selection_only={self._selection_only}, button={button}")
+    def toggle_selection_only_mode(self):
+        """Flip selection-only mode and return the new state"""
+        new_mode = not self._selection_only
+        self.set_selection_only_mode(new_mode)
+        return new_mode
 
+    def _bind_matrix_pressed_handler(self):
+        """Resolve the pad press handler for the current mode once, instead of on every press"""
         if self._selection_only:
-            # In selection-only mode, handle drum pad selection
-            button_coordinate = getattr(button, 'coordinate', None)
-            logger.debug(f"Button coordinate: {button_coordinate}")
-            logger.debug(f"Drum group device valid: {liveobj_valid(self._drum_group_device)}")
-            logger.debug(f"Drum group device: {self._drum_group_device}")
-
-            if button_coordinate and liveobj_valid(self._drum_group_device):
-                # Get the drum pad for this button
-                pad = self._pad_for_button(button)
-                logger.debug(f"Got pad for button: {pad}, valid={liveobj_valid(pad)}")
-
-                if liveobj_valid(pad):
-                    # Get pad name and note
-                    pad_name = getattr(pad, 'name', None)
-                    if pad_name:
-                        pad_name = str(pad_name)
-                    else:
-                        note = getattr(pad, 'note', None)
-                        pad_name = f"Pad {note}" if note is not None else "Unknown Pad"
-
-                    # Get the MIDI note for this pad
-                    note = getattr(pad, 'note', None)
-                    logger.debug(f"Pad note: {note}, pad_name: {pad_name}")
-
-                    if note is not None:
-                        self._selected_drum_pad_note = note
-                        # Update pitch provider if available
-                        if self._pitch_provider:
-                            self._pitch_provider.set_pitch(note)
-                            logger.info(f"Selected drum pad: {pad_name} (MIDI note {note})")
-                        else:
-                            logger.warning("No pitch provider available!")
-
-                    # Select the drum pad in Live
-                    self._do_select_pad(pad, pad_name)
-                else:
-                    logger.warning(f"Pad not valid or not found")
-            else:
-                if not button_coordinate:
-                    logger.warning("No button coordinate")
-                if not liveobj_valid(self._drum_group_device):
-                    logger.warning("Drum group device not valid - is a Drum Rack loaded?")
+            self._on_matrix_pressed = self._on_matrix_pressed_selection
         else:
-            # Use normal drum group behavior - this requires a drum group device
-            logger.debug("Not in selection-only mode, using normal drum group behavior")
-            if liveobj_valid(self._drum_group_device):
-                super()._on_matrix_pressed(button)
+            self._on_matrix_pressed = self._on_matrix_pressed_play
+
+    def _on_matrix_pressed_selection(self, button):
+        """Handle pad presses in selection-only mode: select the drum pad and track its pitch"""
+        if not liveobj_valid(self._drum_group_device):
+            logger.warning("Drum group device not valid - is a Drum Rack loaded?")
+            return
+
+        try:
+            button_coordinate = button.coordinate
+        except AttributeError:
+            button_coordinate = None
+        if not button_coordinate:
+            logger.warning("No button coordinate")
+            return
+
+        # Get the drum pad for this button
+        pad = self._pad_for_button(button)
+        if not liveobj_valid(pad):
+            logger.warning("Pad not valid or not found")
+            return
+
+        # Get the MIDI note for this pad
+        note = getattr(pad, 'note', None)
+        if _DEBUG:
+            logger.debug("Pad pressed: coordinate=%s, pad=%s, note=%s", button_coordinate, pad, note)
+
+        # Defer the Live round-trip so only the last pad of a fast scrub gets selected
+        self._pending_pad = pad
+        self._pending_note = note
+        self._pad_select_task.restart()
+
+    def _apply_pending_pad_select(self):
+        """Track the pitch of and select the last pad pressed in a burst"""
+        pad, note = self._pending_pad, self._pending_note
+        self._pending_pad = None
+        self._pending_note = None
+        if not liveobj_valid(pad):
+            return
+
+        if note is not None:
+            self._selected_drum_pad_note = note
+            # Update pitch provider if available
+            if self._pitch_provider:
+                self._pitch_provider.set_pitch(note)
             else:
-                logger.warning("Cannot use drum group - no drum rack device")
+                logger.warning("No pitch provider available!")
+
+        # Select the drum pad in Live
+        self._do_select_pad(pad, self._pad_display_name(pad, note))
+
+    @staticmethod
+    def _pad_display_name(pad, note):
+        """Name shown when selecting a pad, falling back to its MIDI note"""
+        pad_name = getattr(pad, 'name', None)
+        if pad_name:
+            return str(pad_name)
+        return f"Pad {note}" if note is not None else "Unknown Pad"
+
+    def _on_matrix_pressed_play(self, button):
+        """Handle pad presses in playable mode using the normal drum group behavior"""
+        # Normal drum group behavior requires a drum group device
+        if _DEBUG:
+            logger.debug("Not in selection-only mode, using normal drum group behavior")
+        if liveobj_valid(self._drum_group_device):
+            super()._on_matrix_pressed(button)
+        else:
+            logger.warning("Cannot use drum group - no drum rack device")
 
     def _on_target_track_changed(self):
-        """Handle target track changes from framework's TargetTrackComponent"""
+        """Handle target track changes forwarded by the parent DrumStepSequencerComponent"""
         if not self._target_track:
             return
         current_track = self._target_track.target_track
-        track_name = getattr(current_track, 'name', 'Unknown') if current_track else 'None'
 
         # Update drum group device for the new target track
         if not current_track:
             return
 
-        # Find drum rack device on the target track
-        drum_rack_device = None
-        for device in current_track.devices:
-            if hasattr(device, 'can_have_chains') and device.can_have_chains:
-                drum_rack_device = device
-                break
-
+        drum_rack_device = self._find_drum_rack_device(current_track)
         if drum_rack_device:
             self.set_drum_group_device(drum_rack_device)
 
+    def _find_drum_rack_device(self, track):
+        """Find the first drum rack device on a track"""
+        return next((device for device in track.devices if getattr(device, 'can_have_chains', False)), None)
+
+    def disconnect(self):
+        """Drop references to the sequencer's providers so they don't outlive the component"""
+        super().disconnect()
+        self._pitch_provider = None
+        self._parent_sequencer = None
+        self._pending_pad = None
+
 class CustomNoteEditorComponent(NoteEditorComponent):
     """
     Custom note editor that uses our CustomVelocityProvider instead of the framework's full_velocity.
@@ -271,7 +375,13 @@ class CustomNoteEditorComponent(NoteEditorComponent):
         super().__init__(*a, **k)
         self._custom_velocity_provider = custom_velocity_provider
         self._parent_sequencer = parent_sequencer  # Reference to parent to access double_time_active
-        logger.debug("CustomNoteEditorComponent initialized with custom velocity provider and parent sequencer")
+        # Notes per step shared by the color/velocity lookups of a single redraw
+        self._step_notes_cache = {}
+        self._step_notes_source = None
+        # Set when added notes may be left selected in the clip
+        self._has_selection = False
+        if _DEBUG:
+            logger.debug("CustomNoteEditorComponent initialized with custom velocity provider and parent sequencer")
 
     def _add_new_note_in_step(self, pitch, time):
         """Override to use our custom velocity provider and handle loop extension"""
@@ -284,28 +394,29 @@ class CustomNoteEditorComponent(NoteEditorComponent):
         else:
             velocity = NORMAL_VELOCITY  # Fallback to normal velocity
 
-        if MidiNoteSpecification is None:
-            logger.error("MidiNoteSpecification not available - cannot add note")
-            return
+        # step_length is a property derived from the grid resolution, read it once
+        step_length = self.step_length
 
         # Check if note is outside current loop and extend if necessary
-        note_end_time = time + self.step_length
+        note_end_time = time + step_length
         if self._clip and hasattr(self._clip, 'loop_end'):
             current_loop_end = self._clip.loop_end
+            note_end_ticks = to_ticks(note_end_time)
+            loop_end_ticks = to_ticks(current_loop_end)
 
-            if note_end_time > current_loop_end:
+            if note_end_ticks > loop_end_ticks:
                 # Calculate how many bars to extend (round up to next bar)
-
-                bar_length = get_bar_length(self._clip)
-                bars_to_extend = int((note_end_time - current_loop_end) / bar_length) + 1
-                new_loop_end = current_loop_end + (bars_to_extend * bar_length)
+                bar_ticks = to_ticks(get_bar_length(self._clip))
+                bars_to_extend = (note_end_ticks - loop_end_ticks) // bar_ticks + 1
+                new_loop_end = from_ticks(loop_end_ticks + bars_to_extend * bar_ticks)
 
                 # Extend the loop
                 if hasattr(self._clip, 'loop_end'):
                     self._clip.loop_end = new_loop_end
                 if hasattr(self._clip, 'end_marker'):
                     self._clip.end_marker = new_loop_end
-                logger.debug(f"Extended clip loop from {current_loop_end} to {new_loop_end} to accommodate note at {time}")
+                if _DEBUG:
+                    logger.debug("Extended clip loop from %s to %s to accommodate note at %s", current_loop_end, new_loop_end, time)
 
         # Check if double time mode is active
         double_time_active = False
@@ -314,7 +425,7 @@ class CustomNoteEditorComponent(NoteEditorComponent):
 
         if double_time_active:
             # Add two notes with half the resolution (half the step length)
-            half_duration = self.step_length / 2.0
+            half_duration = step_length / 2.0
 
             note1 = MidiNoteSpecification(
                 pitch=pitch,
@@ -342,7 +453,7 @@ class CustomNoteEditorComponent(NoteEditorComponent):
             note = MidiNoteSpecification(
                 pitch=pitch,
                 start_time=time,
-                duration=(self.step_length),
+                duration=step_length,
                 velocity=velocity,
                 mute=False
             )
@@ -353,33 +464,45 @@ class CustomNoteEditorComponent(NoteEditorComponent):
             else:
                 return
 
-        if hasattr(self._clip, 'deselect_all_notes'):
+        # Newly added notes are deselected once per step release, see _deselect_added_notes
+        self._has_selection = True
+
+    def _deselect_added_notes(self):
+        """Deselect notes added since the last call, skipping the Live call when nothing was added"""
+        if not self._has_selection:
+            return
+        self._has_selection = False
+        if self._has_clip() and hasattr(self._clip, 'deselect_all_notes'):
             self._clip.deselect_all_notes()  # type: ignore
 
     def _get_alternate_color_for_step(self, index, visible_steps):
         """Override to provide velocity-based and double time colors"""
         # Check if this step has notes
         if index in visible_steps:
-            notes = visible_steps[index].filter_notes(self._clip_notes)
+            notes = self._step_notes(visible_steps[index])
             if len(notes) > 0:
                 # Double time takes priority over velocity modifiers
                 if self._parent_sequencer and hasattr(self._parent_sequencer, '_double_time_active'):
                     if self._parent_sequencer._double_time_active:
-                        logger.debug(f"Step {index}: Using double time color (blue)")
-                        return "NoteEditor.StepDoubleTime"
+                        if _DEBUG:
+                            logger.debug("Step %s: Using double time color (blue)", index)
+                        return _COLOR_DOUBLE_TIME
 
                 # Check velocity-based colors (only if double time is not active)
                 if self._custom_velocity_provider:
                     velocity = self._custom_velocity_provider.velocity
                     if velocity >= 127:  # Accent velocity
-                        logger.debug(f"Step {index}: Using accent color (amber), velocity: {velocity}")
-                        return "NoteEditor.StepAccent"
+                        if _DEBUG:
+                            logger.debug("Step %s: Using accent color (amber), velocity: %s", index, velocity)
+                        return _COLOR_ACCENT
                     elif velocity <= 60:  # Soft velocity
-                        logger.debug(f"Step {index}: Using soft color (yellow), velocity: {velocity}")
-                        return "NoteEditor.StepSoft"
+                        if _DEBUG:
+                            logger.debug("Step %s: Using soft color (yellow), velocity: %s", index, velocity)
+                        return _COLOR_SOFT
                     else:  # Normal velocity
-                        logger.debug(f"Step {index}: Using normal color (white), velocity: {velocity}")
-                        return "NoteEditor.StepNormal"
+                        if _DEBUG:
+                            logger.debug("Step %s: Using normal color (white), velocity: %s", index, velocity)
+                        return _COLOR_NORMAL
         return None
 
     def _contract_loop_if_possible(self):
@@ -388,57 +511,75 @@ class CustomNoteEditorComponent(NoteEditorComponent):
             return
 
         current_loop_end = self._clip.loop_end
-        bar_length = get_bar_length(self._clip)
-
-        # Start from the last bar and work backwards
-        last_bar_start = current_loop_end - bar_length
-
-        while last_bar_start >= bar_length:  # Don't go below 1 bar minimum
-            # Check if this bar has any notes
-            if self._bar_has_notes(last_bar_start, bar_length):
-                break  # Found a bar with notes, stop here
-
-            # This bar is empty, remove it
-            new_loop_end = last_bar_start
-            if hasattr(self._clip, 'loop_end'):
-                self._clip.loop_end = new_loop_end
-            if hasattr(self._clip, 'end_marker'):
-                self._clip.end_marker = new_loop_end
-
-            logger.debug(f"Contracted clip loop from {current_loop_end} to {new_loop_end} (removed empty bar)")
-            current_loop_end = new_loop_end
-            last_bar_start = current_loop_end - bar_length
-
-    def _bar_has_notes(self, bar_start, bar_length):
-        """Check if a bar contains any notes"""
-        if not self._has_clip() or not self._clip:
-            return False
+        loop_end_ticks = to_ticks(current_loop_end)
+        bar_ticks = to_ticks(get_bar_length(self._clip))
+
+        # Don't go below 1 bar minimum
+        max_empty_bars = (loop_end_ticks - bar_ticks) // bar_ticks
+        if max_empty_bars <= 0:
+            return
 
         try:
-            # Get all notes in this bar
             notes = self._clip.get_notes_extended(
-                from_time=bar_start,
+                from_time=0,
                 from_pitch=0,
-                time_span=bar_length,
+                time_span=current_loop_end,
                 pitch_span=128
             )
-            return len(notes) > 0
         except Exception as e:
-            logger.warning(f"Error checking for notes in bar: {e}")
-            return True  # If we can't check, assume there are notes to be safe
+            logger.warning("Error checking for notes in loop: %s", e)
+            return  # If we can't check, assume there are notes to be safe
+
+        # Count the empty bars between the latest note and the loop end. Note starts are
+        # floored, so a note just before a bar line never rounds up into the next bar
+        if len(notes) > 0:
+            last_note_ticks = int(max(note.start_time for note in notes) * PPQ)
+            empty_bars = min((loop_end_ticks - last_note_ticks - 1) // bar_ticks, max_empty_bars)
+        else:
+            empty_bars = max_empty_bars
+
+        if empty_bars <= 0:
+            return
+
+        new_loop_end = from_ticks(loop_end_ticks - empty_bars * bar_ticks)
+        if hasattr(self._clip, 'loop_end'):
+            self._clip.loop_end = new_loop_end
+        if hasattr(self._clip, 'end_marker'):
+            self._clip.end_marker = new_loop_end
+
+        if _DEBUG:
+            logger.debug("Contracted clip loop from %s to %s (removed %d empty bar(s))", current_loop_end, new_loop_end, empty_bars)
 
     def _get_velocity_for_step(self, step):
         """Get the velocity of the first note in a step"""
         if not self._has_clip():
             return None
 
-        time_step = self._time_step(self._get_step_start_time(step))
-        notes = time_step.filter_notes(self._clip_notes)
+        notes = self._step_notes(self._time_step(self._get_step_start_time(step)))
 
         if notes:
             return notes[0].velocity
         return None
 
+    def _step_notes(self, time_step):
+        """Get the clip notes in a time step, memoized until the clip notes change or steps refresh"""
+        clip_notes = self._clip_notes
+        if clip_notes is not self._step_notes_source:
+            self._step_notes_cache.clear()
+            self._step_notes_source = clip_notes
+
+        key = (time_step.start, self.step_length)
+        notes = self._step_notes_cache.get(key)
+        if notes is None:
+            notes = time_step.filter_notes(clip_notes)
+            self._step_notes_cache[key] = notes
+        return notes
+
+    def _refresh_active_steps(self):
+        """Override to drop memoized step notes before the steps are redrawn"""
+        self._step_notes_cache.clear()
+        super()._refresh_active_steps()
+
     def _get_color_for_step(self, index, visible_steps):
         """Override to provide velocity-based and double time colors"""
         # Get the base color from parent
@@ -446,8 +587,7 @@ class CustomNoteEditorComponent(NoteEditorComponent):
 
         # If there's a note in this step, check for double time and velocity-based colors
         if self._has_clip() and index in visible_steps:
-            step = visible_steps[index]
-            notes = step.filter_notes(self._clip_notes)
+            notes = self._step_notes(visible_steps[index])
 
             if len(notes) > 0:
                 # Check if this step contains double time notes (two notes with half duration)
@@ -462,16 +602,10 @@ class CustomNoteEditorComponent(NoteEditorComponent):
 
                     if (abs(note1_duration - half_duration) < 0.01 and
                         abs(note2_duration - half_duration) < 0.01):
-                        return "NoteEditor.StepDoubleTime"
+                        return _COLOR_DOUBLE_TIME
 
                 # Use the actual note velocity for single notes or non-double-time notes
-                velocity = notes[0].velocity
-                if velocity >= ACCENT_VELOCITY:
-                    return "NoteEditor.StepAccent"
-                elif velocity <= SOFT_VELOCITY:
-                    return "NoteEditor.StepSoft"
-                else:
-                    return "NoteEditor.StepNormal"
+                return _VEL_COLOR[int(notes[0].velocity)]
         return base_color
 
     def _on_release_step(self, step, can_add_or_remove=False):
@@ -495,42 +629,47 @@ class CustomNoteEditorComponent(NoteEditorComponent):
                     # If current velocity matches existing velocity, delete the note
                     if current_velocity == existing_velocity:
                         self._delete_notes_in_step(step)
-                        logger.debug(f"Deleted note with matching velocity: {current_velocity}")
+                        if _DEBUG:
+                            logger.debug("Deleted note with matching velocity: %s", current_velocity)
                         # After deleting notes, check if we can contract the loop
                         self._contract_loop_if_possible()
                     else:
                         # Different velocity - update existing notes with new velocity
-                        self._update_notes_velocity_in_step(step)
-                        logger.debug(f"Updated note velocity: {existing_velocity} → {current_velocity}")
+                        self._update_notes_velocity_in_step(existing_notes)
+                        if _DEBUG:
+                            logger.debug("Updated note velocity: %s → %s", existing_velocity, current_velocity)
                 else:
                     # No existing notes - add new ones
                     for pitch in self._pitches:
                         self._add_note_in_step(step, pitch)
+                    self._deselect_added_notes()
 
         step.is_active = False
         self._refresh_active_steps()
 
-    def _update_notes_velocity_in_step(self, step):
-        """Update the velocity of existing notes in a step"""
+    def _update_notes_velocity_in_step(self, existing_notes):
+        """Update the velocity of the given notes, already filtered to the time step"""
         if not self._has_clip() or not self._custom_velocity_provider:
             return
 
+        if not hasattr(self._clip, 'apply_note_modifications'):
+            logger.warning("Clip does not have apply_note_modifications method")
+            return
+
         new_velocity = self._custom_velocity_provider.velocity
-        time_step = self._time_step(self._get_step_start_time(step))
-        existing_notes = time_step.filter_notes(self._clip_notes)
+        note_ids = tuple(note.note_id for note in existing_notes if note.velocity != new_velocity)
+        if not note_ids:
+            return
 
-        if existing_notes:
-            # Update velocity for all notes in this step
-            for note in existing_notes:
-                note.velocity = new_velocity
+        # apply_note_modifications only accepts a MidiNoteVector, so fetch exactly these notes
+        note_vector = self._clip.get_notes_by_id(note_ids)  # type: ignore
+        for note in note_vector:
+            note.velocity = new_velocity
 
-            # Apply the modifications to the clip
-            if hasattr(self._clip, 'apply_note_modifications'):
-                self._clip.apply_note_modifications(self._clip_notes)  # type: ignore
-            else:
-                logger.warning("Clip does not have apply_note_modifications method")
+        self._clip.apply_note_modifications(note_vector)  # type: ignore
 
-            logger.debug(f"Updated {len(existing_notes)} note(s) to velocity: {new_velocity}")
+        if _DEBUG:
+            logger.debug("Updated %d note(s) to velocity: %s", len(note_ids), new_velocity)
 
 
 class DrumStepSequencerComponent(Component):
@@ -596,69 +735,57 @@ class DrumStepSequencerComponent(Component):
     )
 
     velocity_accent_button = ButtonControl(
-        color="DrumStepSequencer.VelocityAccentOff"
+        color=_C_ACCENT_OFF
     )
     velocity_soft_button = ButtonControl(
-        color="DrumStepSequencer.VelocitySoftOff"
+        color=_C_SOFT_OFF
     )
 
     @depends(target_track=None)
     def __init__(self, name="Drum_Step_Sequencer", target_track=None, *a, **k):
         try:
-            logger.info("=" * 60)
-            logger.info("STARTING DrumStepSequencerComponent.__init__")
-            logger.info("=" * 60)
-
-            logger.debug(f"Args: name={name}, target_track={target_track}")
-            logger.debug(f"Additional args: {a}, kwargs: {k}")
+            if _DEBUG:
+                logger.debug("Args: name=%s, target_track=%s", name, target_track)
+                logger.debug("Additional args: %s, kwargs: %s", a, k)
 
             # Call parent init
             try:
                 super().__init__(name=name, *a, **k)
-                logger.debug("Parent Component.__init__ successful")
             except Exception as e:
                 logger.error(f"Parent Component.__init__ FAILED: {e}", exc_info=True)
                 raise
 
             # Store dependencies
             self._target_track = target_track
-            logger.debug(f"Stored target_track: {target_track}")
-
 
             # Listen to target track changes
             if self._target_track:
                 self.register_slot(self._target_track, self._on_target_track_changed, "target_track")
                 self.register_slot(self._target_track, self._on_target_clip_changed, "target_clip")
-                logger.debug("Registered target track and clip listeners")
-
+                if _DEBUG:
+                    logger.debug("Registered target track and clip listeners")
 
             # Create custom velocity provider
             try:
-                logger.debug("Creating CustomVelocityProvider...")
                 self._velocity_provider = CustomVelocityProvider()
-                logger.info("CustomVelocityProvider created successfully")
             except Exception as e:
                 logger.error(f"CustomVelocityProvider FAILED: {e}", exc_info=True)
                 raise
 
             # Create double time state
             self._double_time_active = False
-            logger.debug("Double time state initialized to False")
 
             # Create pitch provider first (needed by drum group)
             try:
-                logger.debug("Creating DrumPadPitchProvider...")
                 self._pitch_provider = DrumPadPitchProvider(
                     drum_group_component=None  # Will be set after drum group is created
                 )
-                logger.info("DrumPadPitchProvider created successfully")
             except Exception as e:
                 logger.error(f"DrumPadPitchProvider FAILED: {e}", exc_info=True)
                 raise
 
             # Initialize composed drum group component with pitch provider reference
             try:
-                logger.debug("Creating CustomDrumGroupComponent...")
                 self._drum_group = CustomDrumGroupComponent(
                     name="Drum_Group",
                     target_track=target_track,
@@ -667,39 +794,35 @@ class DrumStepSequencerComponent(Component):
                 )
                 # Set parent sequencer reference for lock state checking
                 self._drum_group.set_parent_sequencer(self)
+                # Mirror of the drum group's mode, kept in sync by the mode setters below
+                self._selection_only = self._drum_group.selection_only
                 # Update the pitch provider's drum group reference
                 self._pitch_provider._drum_group = self._drum_group
-                logger.info("CustomDrumGroupComponent created successfully")
             except Exception as e:
                 logger.error(f"CustomDrumGroupComponent FAILED: {e}", exc_info=True)
                 raise
 
             # Create sequencer clip helper
             try:
-                logger.debug("Creating SequencerClip...")
                 self._sequencer_clip = SequencerClip(
                     target_track=target_track
                 )
-                logger.info("SequencerClip created successfully")
             except Exception as e:
                 logger.error(f"SequencerClip FAILED: {e}", exc_info=True)
                 raise
 
             # Create our own grid resolution component
             try:
-                logger.debug("Creating GridResolutionComponent...")
                 self._grid_resolution = GridResolutionComponent(
                     name="Grid_Resolution",
                     parent=self
                 )
-                logger.info("GridResolutionComponent created successfully")
             except Exception as e:
                 logger.error(f"GridResolutionComponent FAILED: {e}", exc_info=True)
                 raise
 
             # Note editor for step input (custom component with velocity control)
             try:
-                logger.debug("Creating CustomNoteEditorComponent...")
                 # Inject sequencer_clip dependency
                 with inject(sequencer_clip=const(self._sequencer_clip)).everywhere():
                     self._note_editor = CustomNoteEditorComponent(
@@ -708,75 +831,89 @@ class DrumStepSequencerComponent(Component):
                         grid_resolution=self._grid_resolution,
                         parent=self
                     )
-                logger.debug("Setting pitch provider on note editor...")
                 self._note_editor.pitch_provider = self._pitch_provider
-                logger.info("CustomNoteEditorComponent created successfully")
 
                 # Check if the note editor has a sequencer_clip property
-                if hasattr(self._note_editor, 'sequencer_clip'):
-                    logger.info(f"NoteEditor has sequencer_clip: {self._note_editor.sequencer_clip}")
-                else:
-                    logger.info("NoteEditor does not have sequencer_clip property")
+                if _DEBUG:
+                    if hasattr(self._note_editor, 'sequencer_clip'):
+                        logger.debug("NoteEditor has sequencer_clip: %s", self._note_editor.sequencer_clip)
+                    else:
+                        logger.debug("NoteEditor does not have sequencer_clip property")
 
             except Exception as e:
                 logger.error(f"NoteEditorComponent FAILED: {e}", exc_info=True)
                 raise
 
-            # Paginator for page management
+            # Child capabilities are fixed per instance, so resolve them once
+            self._drum_group_has_set_target = hasattr(self._drum_group, 'set_target_track')
+            self._sequencer_clip_has_set_target = hasattr(self._sequencer_clip, 'set_target_track')
+            self._last_target_track = None
+
+            # Child components waiting for the next coalesced update
+            self._pending_child_updates = []
+            self._update_scheduled = False
+
+            # Bumped whenever children need refreshing; update() skips the cascade when unchanged
+            self._dirty_generation = 0
+            self._last_updated_generation = None
+
+            # Paginator for page management. Built eagerly: it and the loop selector do
+            # their work by hooking into the note editor and this component when constructed
             try:
-                logger.debug("Creating NoteEditorPaginator...")
                 self._paginator = NoteEditorPaginator(
                     note_editor=self._note_editor,
                     parent=self
                 )
-                logger.info("NoteEditorPaginator created successfully")
+                if _DEBUG:
+                    logger.debug("NoteEditorPaginator created")
             except Exception as e:
-                logger.error(f"NoteEditorPaginator FAILED: {e}", exc_info=True)
+                logger.error("NoteEditorPaginator FAILED: %s", e, exc_info=True)
                 raise
 
             # Loop selector (optional - may fail due to dependencies)
             self._loop_selector = None
             try:
-                logger.debug("Creating LoopSelectorComponent (optional)...")
                 self._loop_selector = LoopSelectorComponent(
                     paginator=self._paginator,
                     parent=self
                 )
-                logger.info("LoopSelectorComponent created successfully")
+                if _DEBUG:
+                    logger.debug("LoopSelectorComponent created")
             except Exception as e:
-                logger.warning(f"LoopSelectorComponent skipped: {e}")
+                logger.warning("LoopSelectorComponent skipped: %s", e)
                 self._loop_selector = None
 
             # Playhead component removed for now (not working properly)
             self._playhead = None
-            logger.debug("Playhead component disabled")
 
-            logger.info("=" * 60)
-            logger.info("✓✓DrumStepSequencerComponent INITIALIZED SUCCESSFULLY ✓✓✓")
-            logger.info("=" * 60)
+            # Valid target clip whose playing status drives the play button, refreshed
+            # only when the target clip changes
+            self._status_clip = None
+            self._setup_clip_playing_status_listener()
+
+            logger.info("DrumStepSequencerComponent initialized")
 
         except Exception as e:
-            logger.error("=" * 60)
-            logger.error(f"✗✗DrumStepSequencerComponent INITIALIZATION FAILED ✗✗✗")
-            logger.error(f"Error: {e}")
-            logger.error("=" * 60)
-            logger.error("Full traceback:", exc_info=True)
+            logger.error(f"DrumStepSequencerComponent initialization failed: {e}", exc_info=True)
             raise
 
     @mode_toggle_button.toggled
     def _on_mode_toggle_button_toggled(self, is_toggled, button):
         """Handle mode toggle button toggle"""
-        logger.info(f"Mode toggle button toggled to: {is_toggled}")
+        if _DEBUG:
+            logger.debug("Mode toggle button toggled to: %s", is_toggled)
         # Set the selection mode based on the toggle state (inverted logic)
         # When button is ON (is_toggled=True) → Playable mode (selection_only=False)
         # When button is OFF (is_toggled=False) → Selection mode (selection_only=True)
         self.set_selection_only_mode(not is_toggled)
-        logger.info(f"Mode set to: {'Selection' if not is_toggled else 'Playable'}")
+        if _DEBUG:
+            logger.debug("Mode set to: %s", 'Selection' if not is_toggled else 'Playable')
 
     @play_button.toggled
     def _on_play_button_toggled(self, is_toggled, button):
         """Handle play button toggle - start/stop current clip"""
-        logger.info(f"Play button toggled to: {is_toggled}")
+        if _DEBUG:
+            logger.debug("Play button toggled to: %s", is_toggled)
 
         if not self._target_track or not self._target_track.target_track:
             logger.warning("No target track available for play button")
@@ -804,18 +941,18 @@ class DrumStepSequencerComponent(Component):
 
                         # Fire the clip slot with quantization
                         clip_slot.fire(launch_quantization=launch_quantization)
-                        logger.info(f"Started playing clip with quantization: {getattr(current_clip, 'name', 'Unnamed')}")
+                        logger.info("Started playing clip with quantization: %s", getattr(current_clip, 'name', 'Unnamed'))
                     else:
                         # Fallback to immediate fire if clip slot not found
                         current_clip.fire()
-                        logger.info(f"Started playing clip immediately: {getattr(current_clip, 'name', 'Unnamed')}")
+                        logger.info("Started playing clip immediately: %s", getattr(current_clip, 'name', 'Unnamed'))
                 else:
                     logger.info("Clip is already playing")
             else:
                 # Button released - stop playing the clip
                 if current_clip.is_playing:
                     current_clip.stop()
-                    logger.info(f"Stopped playing clip: {getattr(current_clip, 'name', 'Unnamed')}")
+                    logger.info("Stopped playing clip: %s", getattr(current_clip, 'name', 'Unnamed'))
                 else:
                     logger.info("Clip is already stopped")
         except Exception as e:
@@ -880,43 +1017,36 @@ class DrumStepSequencerComponent(Component):
         """Handle target track changes from framework's TargetTrackComponent"""
         if not self._target_track:
             return
-        current_track = self._target_track.target_track
-        track_name = getattr(current_track, 'name', 'Unknown') if current_track else 'None'
-        is_locked = getattr(self._target_track, 'is_locked_to_track', False)
-        logger.info(f"Target track changed: {track_name} (locked: {is_locked})")
+        if logger.isEnabledFor(logging.INFO):
+            current_track = self._target_track.target_track
+            track_name = getattr(current_track, 'name', 'Unknown') if current_track else 'None'
+            is_locked = getattr(self._target_track, 'is_locked_to_track', False)
+            logger.info("Target track changed: %s (locked: %s)", track_name, is_locked)
+        self._dirty_generation += 1
 
         # Update child components to use new target track
         self._update_child_components()
 
-        # Update drum group device for the new target track
-        if not current_track:
-            return
-
-        # Find drum rack device on the target track
-        drum_rack_device = None
-        for device in current_track.devices:
-            if hasattr(device, 'can_have_chains') and device.can_have_chains:
-                drum_rack_device = device
-                break
-
-        if drum_rack_device:
-            self.set_drum_group_device(drum_rack_device)
+        # Let the drum group pick up the drum rack on the new target track
+        self._drum_group._on_target_track_changed()
 
     def _on_target_clip_changed(self):
         """Handle target clip changes from framework's TargetTrackComponent"""
         if not self._target_track:
             return
 
-        current_clip = self._target_track.target_clip
-        clip_name = getattr(current_clip, 'name', 'None') if current_clip else 'None'
-        logger.info(f"=== Target clip changed: {clip_name} ===")
-
-        # Update play button state to reflect new clip's playing status
-        self._update_play_button_state()
+        if _DEBUG:
+            current_clip = self._target_track.target_clip
+            clip_name = getattr(current_clip, 'name', 'None') if current_clip else 'None'
+            logger.debug("Target clip changed: %s", clip_name)
+        self._dirty_generation += 1
 
         # Set up listener for clip playing status changes
         self._setup_clip_playing_status_listener()
 
+        # Update play button state to reflect new clip's playing status
+        self._update_play_button_state()
+
     # Double time button handlers
     @double_time_button.pressed
     def _on_double_time_button_pressed(self, button):
@@ -939,7 +1069,7 @@ class DrumStepSequencerComponent(Component):
     def _on_velocity_accent_button_pressed(self, button):
         """Handle accent button press"""
         self._velocity_provider.set_accent_pressed(True)
-        button.color = "DrumStepSequencer.VelocityAccentOn"
+        _set_button_color(button, _C_ACCENT_ON)
         if hasattr(self, '_note_editor') and self._note_editor:
             self._note_editor._update_editor_matrix()
 
@@ -947,7 +1077,7 @@ class DrumStepSequencerComponent(Component):
     def _on_velocity_accent_button_released(self, button):
         """Handle accent button release"""
         self._velocity_provider.set_accent_pressed(False)
-        button.color = "DrumStepSequencer.VelocityAccentOff"
+        _set_button_color(button, _C_ACCENT_OFF)
         if hasattr(self, '_note_editor') and self._note_editor:
             self._note_editor._update_editor_matrix()
 
@@ -955,7 +1085,7 @@ class DrumStepSequencerComponent(Component):
     def _on_velocity_soft_button_pressed(self, button):
         """Handle soft button press"""
         self._velocity_provider.set_soft_pressed(True)
-        button.color = "DrumStepSequencer.VelocitySoftOn"
+        _set_button_color(button, _C_SOFT_ON)
         if hasattr(self, '_note_editor') and self._note_editor:
             self._note_editor._update_editor_matrix()
 
@@ -963,7 +1093,7 @@ class DrumStepSequencerComponent(Component):
     def _on_velocity_soft_button_released(self, button):
         """Handle soft button release"""
         self._velocity_provider.set_soft_pressed(False)
-        button.color = "DrumStepSequencer.VelocitySoftOff"
+        _set_button_color(button, _C_SOFT_OFF)
         if hasattr(self, '_note_editor') and self._note_editor:
             self._note_editor._update_editor_matrix()
 
@@ -985,70 +1115,72 @@ class DrumStepSequencerComponent(Component):
     @drum_group_matrix.setter
     def drum_group_matrix(self, matrix):
         """Set the matrix for the drum step sequencer (required by Ableton framework)"""
-        logger.debug("Setting drum group matrix via property setter")
-        logger.debug(f"Matrix type: {type(matrix)}, Matrix: {matrix}")
-
-        # Only set matrix if we have a valid matrix (not None)
-        # This prevents the component from being disconnected when not in drum mode
-        if matrix is not None:
-            self._drum_group.set_matrix(matrix)
-            logger.info("Drum group matrix set successfully via property")
-        else:
-            logger.debug("Skipping None matrix via property setter - component not in drum mode")
-
-    def set_drum_group_matrix(self, matrix):
-        """Set the matrix for the drum step sequencer (legacy method)"""
-        logger.debug(f"Setting matrix for drum step sequencer via method - enabled: {self.is_enabled()}")
-        logger.debug(f"Matrix type: {type(matrix)}, Matrix: {matrix}")
+        if _DEBUG:
+            logger.debug("Setting drum group matrix - enabled: %s, type: %s, matrix: %r", self.is_enabled(), type(matrix), matrix)
 
         # Only set matrix if we have a valid matrix (not None)
         # This prevents the component from being disconnected when not in drum mode
         if matrix is not None:
             # Pass the matrix to the drum group component
             self._drum_group.set_matrix(matrix)
-            logger.info("Matrix set for drum step sequencer")
+            self._dirty_generation += 1
+            if _DEBUG:
+                logger.debug("Matrix set for drum step sequencer")
         else:
-            logger.debug("Skipping None matrix - component not in drum mode")
+            if _DEBUG:
+                logger.debug("Skipping None matrix - component not in drum mode")
+
+    # Method form of the setter, without an extra call frame
+    set_drum_group_matrix = drum_group_matrix.fset
 
     def set_drum_group_device(self, drum_group_device):
         """Set the drum group device for the drum group component"""
         self._drum_group.set_drum_group_device(drum_group_device)
+        self._dirty_generation += 1
 
-    def set_step_sequence_matrix(self, matrix):
-        """Set the matrix for the step sequencer grid (8x4 = 32 steps)"""
-        logger.debug("Setting step sequence matrix")
-        logger.debug(f"Matrix type: {type(matrix)}, Matrix: {matrix}")
+    @property
+    def step_sequence_matrix(self):
+        """Get the step sequence matrix (required by Ableton framework)"""
+        return self._note_editor.matrix
+
+    @step_sequence_matrix.setter
+    def step_sequence_matrix(self, matrix):
+        """Set the matrix for the step sequencer grid, 8x4 = 32 steps (required by Ableton framework)"""
+        if _DEBUG:
+            logger.debug("Setting step sequence matrix - type: %s, matrix: %r", type(matrix), matrix)
 
         # Only set matrix if we have a valid matrix (not None)
         # This prevents the component from being disconnected when not in drum mode
         if matrix is not None:
             # Connect matrix to note editor - this handles step programming and visual feedback
             self._note_editor.set_matrix(matrix)
-            logger.info("Step sequence matrix set successfully")
+            self._dirty_generation += 1
+            if _DEBUG:
+                logger.debug("Step sequence matrix set successfully")
         else:
-            logger.debug("Skipping None step sequence matrix - component not in drum mode")
-
-    @property
-    def step_sequence_matrix(self):
-        """Get the step sequence matrix (required by Ableton framework)"""
-        return self._note_editor.matrix
+            if _DEBUG:
+                logger.debug("Skipping None step sequence matrix - component not in drum mode")
 
-    @step_sequence_matrix.setter
-    def step_sequence_matrix(self, matrix):
-        """Set the step sequence matrix via property (required by Ableton framework)"""
-        self.set_step_sequence_matrix(matrix)
+    # Method form of the setter, without an extra call frame
+    set_step_sequence_matrix = step_sequence_matrix.fset
 
     def set_selection_only_mode(self, enabled):
         """Enable or disable selection-only mode for drum pads"""
-        logger.info(f"Setting selection-only mode: {enabled}")
+        if self._selection_only == enabled:
+            return
+        if _DEBUG:
+            logger.debug("Setting selection-only mode: %s", enabled)
         self._drum_group.set_selection_only_mode(enabled)
+        self._selection_only = enabled
+        self._dirty_generation += 1
 
     def toggle_selection_only_mode(self):
         """Toggle between selection-only and normal playable mode"""
-        current_mode = self._drum_group._selection_only
-        new_mode = not current_mode
-        self.set_selection_only_mode(new_mode)
-        logger.info(f"Toggled selection-only mode to: {new_mode}")
+        new_mode = self._drum_group.toggle_selection_only_mode()
+        self._selection_only = new_mode
+        self._dirty_generation += 1
+        if _DEBUG:
+            logger.debug("Toggled selection-only mode to: %s", new_mode)
         return new_mode
 
     def _update_child_components(self):
@@ -1056,14 +1188,16 @@ class DrumStepSequencerComponent(Component):
         if not self._target_track:
             return
         current_track = self._target_track.target_track
-        if not current_track:
+        if not current_track or current_track == self._last_target_track:
             return
+        self._last_target_track = current_track
+
         # Update drum group to use current target track
-        if hasattr(self._drum_group, 'set_target_track'):
+        if self._drum_group_has_set_target:
             self._drum_group.set_target_track(current_track)
 
         # Update sequencer clip to use current target track
-        if hasattr(self._sequencer_clip, 'set_target_track'):
+        if self._sequencer_clip_has_set_target:
             self._sequencer_clip.set_target_track(current_track)
 
     def set_drum_rack_level_component(self, drum_rack_level_component):
@@ -1076,38 +1210,45 @@ class DrumStepSequencerComponent(Component):
 
     def _update_play_button_state(self):
         """Update play button state to reflect current clip's playing status"""
-        if not self._target_track or not self._target_track.target_clip:
+        current_clip = self._status_clip
+        if current_clip is None:
             # No clip available - button should be off
             self.play_button.is_on = False
-            logger.debug("No target clip - play button set to OFF")
+            if _DEBUG:
+                logger.debug("No target clip - play button set to OFF")
             return
 
-        current_clip = self._target_track.target_clip
         is_playing = getattr(current_clip, 'is_playing', False)
 
         # Update button state to match clip playing status
         self.play_button.is_on = is_playing
-        logger.debug(f"Play button state updated: {'ON' if is_playing else 'OFF'} (clip playing: {is_playing})")
+        if _DEBUG:
+            logger.debug("Play button state updated: %s (clip playing: %s)", 'ON' if is_playing else 'OFF', is_playing)
 
     def _setup_clip_playing_status_listener(self):
         """Set up listener for clip playing status changes"""
         # Clear any existing listener
         self._DrumStepSequencerComponent__on_clip_playing_status_changed.subject = None
+        self._status_clip = None
 
         if not self._target_track or not self._target_track.target_clip:
-            logger.debug("No target clip available for playing status listener")
+            if _DEBUG:
+                logger.debug("No target clip available for playing status listener")
             return
 
         current_clip = self._target_track.target_clip
         if liveobj_valid(current_clip):
             # Set up listener for playing status changes
+            self._status_clip = current_clip
             self._DrumStepSequencerComponent__on_clip_playing_status_changed.subject = current_clip
-            logger.debug(f"Set up playing status listener for clip: {getattr(current_clip, 'name', 'Unnamed')}")
+            if _DEBUG:
+                logger.debug("Set up playing status listener for clip: %s", getattr(current_clip, 'name', 'Unnamed'))
 
     @listens("playing_status")  # type: ignore
     def _DrumStepSequencerComponent__on_clip_playing_status_changed(self):
         """Handle clip playing status changes"""
-        logger.debug("Clip playing status changed")
+        if _DEBUG:
+            logger.debug("Clip playing status changed")
         self._update_play_button_state()
 
     def _find_clip_slot_for_clip(self, track, clip):
@@ -1123,26 +1264,29 @@ class DrumStepSequencerComponent(Component):
 
     def _navigate_clip_slot(self, direction):
         """Navigate to the next/previous clip slot"""
+        song_view = self.song.view
         # Check if sequencer is locked to a track
         if self._target_track and hasattr(self._target_track, 'is_locked_to_track') and self._target_track.is_locked_to_track:
             # If locked, use the locked track for clip creation
             current_track = self._target_track.target_track
             current_clip = self._target_track.target_clip
-            logger.info(f"Sequencer is locked to track {current_track.name if current_track else 'None'}")
+            if _DEBUG:
+                logger.debug("Sequencer is locked to track %s", current_track.name if current_track else 'None')
         else:
             # If not locked, use the currently selected track in Ableton Live
-            if not hasattr(self.song.view, 'selected_track') or not self.song.view.selected_track:
+            if not hasattr(song_view, 'selected_track') or not song_view.selected_track:
                 logger.warning("No track selected in Ableton Live for navigation")
                 return
 
-            current_track = self.song.view.selected_track
+            current_track = song_view.selected_track
             current_clip = None
 
             # Get the currently highlighted clip if any
-            if hasattr(self.song.view, 'highlighted_clip_slot') and self.song.view.highlighted_clip_slot:
-                if hasattr(self.song.view.highlighted_clip_slot, 'clip'):
-                    current_clip = self.song.view.highlighted_clip_slot.clip
-            logger.info(f"Using currently selected track {current_track.name}")
+            if hasattr(song_view, 'highlighted_clip_slot') and song_view.highlighted_clip_slot:
+                if hasattr(song_view.highlighted_clip_slot, 'clip'):
+                    current_clip = song_view.highlighted_clip_slot.clip
+            if _DEBUG:
+                logger.debug("Using currently selected track %s", current_track.name)
 
         if not hasattr(current_track, 'clip_slots'):
             logger.warning("Target track has no clip slots")
@@ -1165,29 +1309,30 @@ class DrumStepSequencerComponent(Component):
 
         # Check bounds
         if new_slot_index < 0 or new_slot_index >= len(current_track.clip_slots):
-            logger.info(f"Navigation would go out of bounds (index {new_slot_index})")
+            logger.info("Navigation would go out of bounds (index %d)", new_slot_index)
             return
 
         new_clip_slot = current_track.clip_slots[new_slot_index]
 
         # If the new slot is empty, create an empty clip
         if not hasattr(new_clip_slot, 'has_clip') or not new_clip_slot.has_clip:
-            logger.info(f"Creating empty clip in slot {new_slot_index}")
+            logger.info("Creating empty clip in slot %d", new_slot_index)
             clip_created = self._create_empty_clip_in_slot(new_clip_slot)
             if not clip_created:
-                logger.warning(f"Failed to create clip in slot {new_slot_index}")
+                logger.warning("Failed to create clip in slot %d", new_slot_index)
                 return
 
         # Always update Ableton Live's session view to show the navigation
-        if hasattr(self.song.view, 'selected_track') and self.song.view.selected_track:
+        if hasattr(song_view, 'selected_track') and song_view.selected_track:
             # Find the corresponding clip slot in the currently viewed track
-            viewed_track = self.song.view.selected_track
+            viewed_track = song_view.selected_track
             if hasattr(viewed_track, 'clip_slots') and new_slot_index < len(viewed_track.clip_slots):
                 viewed_clip_slot = viewed_track.clip_slots[new_slot_index]
                 # Highlight the corresponding row in the currently viewed track
-                if hasattr(self.song.view, 'highlighted_clip_slot'):
-                    self.song.view.highlighted_clip_slot = viewed_clip_slot
-                logger.info(f"Highlighted row {new_slot_index} in viewed track {viewed_track.name}")
+                if hasattr(song_view, 'highlighted_clip_slot'):
+                    song_view.highlighted_clip_slot = viewed_clip_slot
+                if _DEBUG:
+                    logger.debug("Highlighted row %d in viewed track %s", new_slot_index, viewed_track.name)
 
         # Update the sequencer's target clip if locked
         if self._target_track and hasattr(self._target_track, 'is_locked_to_track') and self._target_track.is_locked_to_track:
@@ -1196,12 +1341,12 @@ class DrumStepSequencerComponent(Component):
                 self._target_track._target_clip = new_clip_slot.clip
                 self._target_track.notify_target_clip()
                 self._on_target_clip_changed()
-                logger.info(f"Updated sequencer target clip to slot {new_slot_index} of locked track {current_track.name}")
+                logger.info("Updated sequencer target clip to slot %d of locked track %s", new_slot_index, current_track.name)
             else:
                 self._target_track._target_clip = None
                 self._target_track.notify_target_clip()
                 self._on_target_clip_changed()
-                logger.info(f"Updated sequencer target clip to None for slot {new_slot_index} of locked track {current_track.name}")
+                logger.info("Updated sequencer target clip to None for slot %d of locked track %s", new_slot_index, current_track.name)
 
     def _create_empty_clip_in_slot(self, clip_slot):
         """Create an empty clip in the given clip slot"""
@@ -1213,7 +1358,7 @@ class DrumStepSequencerComponent(Component):
             # Create a 1-bar empty clip
             clip_length = get_bar_length()
             clip_slot.create_clip(clip_length)
-            logger.info(f"Created empty clip with length {clip_length}")
+            logger.info("Created empty clip with length %s", clip_length)
             return True
         except Exception as e:
             logger.error(f"Error creating empty clip: {e}")
@@ -1221,26 +1366,29 @@ class DrumStepSequencerComponent(Component):
 
     def _create_clip_variant(self):
         """Create a variant (duplicate) of the current clip"""
+        song_view = self.song.view
         # Check if sequencer is locked to a track
         if self._target_track and hasattr(self._target_track, 'is_locked_to_track') and self._target_track.is_locked_to_track:
             # If locked, use the locked track for variant creation
             current_track = self._target_track.target_track
             current_clip = self._target_track.target_clip
-            logger.info(f"Sequencer is locked to track {current_track.name if current_track else 'None'} for variant creation")
+            if _DEBUG:
+                logger.debug("Sequencer is locked to track %s for variant creation", current_track.name if current_track else 'None')
         else:
             # If not locked, use the currently selected track in Ableton Live
-            if not hasattr(self.song.view, 'selected_track') or not self.song.view.selected_track:
+            if not hasattr(song_view, 'selected_track') or not song_view.selected_track:
                 logger.warning("No track selected in Ableton Live for variant creation")
                 return
 
-            current_track = self.song.view.selected_track
+            current_track = song_view.selected_track
             current_clip = None
 
             # Get the currently highlighted clip if any
-            if hasattr(self.song.view, 'highlighted_clip_slot') and self.song.view.highlighted_clip_slot:
-                if hasattr(self.song.view.highlighted_clip_slot, 'clip'):
-                    current_clip = self.song.view.highlighted_clip_slot.clip
-            logger.info(f"Using currently selected track {current_track.name} for variant creation")
+            if hasattr(song_view, 'highlighted_clip_slot') and song_view.highlighted_clip_slot:
+                if hasattr(song_view.highlighted_clip_slot, 'clip'):
+                    current_clip = song_view.highlighted_clip_slot.clip
+            if _DEBUG:
+                logger.debug("Using currently selected track %s for variant creation", current_track.name)
 
         if not current_clip:
             logger.warning("No current clip to create variant from")
@@ -1286,14 +1434,14 @@ class DrumStepSequencerComponent(Component):
                 if source_slot_index is not None:
                     # Use the track's duplicate_clip_slot method
                     new_slot_index = current_track.duplicate_clip_slot(source_slot_index)
-                    logger.info(f"Duplicated clip from slot {source_slot_index} to slot {new_slot_index}")
+                    logger.info("Duplicated clip from slot %d to slot %d", source_slot_index, new_slot_index)
 
                     # Get the new clip slot
                     if new_slot_index < len(current_track.clip_slots):
                         next_empty_slot = current_track.clip_slots[new_slot_index]
                         next_empty_index = new_slot_index
                     else:
-                        logger.warning(f"Duplicate returned invalid slot index: {new_slot_index}")
+                        logger.warning("Duplicate returned invalid slot index: %s", new_slot_index)
                         return
                 else:
                     logger.warning("Could not find source clip slot for duplication")
@@ -1304,15 +1452,16 @@ class DrumStepSequencerComponent(Component):
 
             # Navigate to the new variant
             # Always update Ableton Live's session view to show the navigation
-            if hasattr(self.song.view, 'selected_track') and self.song.view.selected_track:
+            if hasattr(song_view, 'selected_track') and song_view.selected_track:
                 # Find the corresponding clip slot in the currently viewed track
-                viewed_track = self.song.view.selected_track
+                viewed_track = song_view.selected_track
                 if hasattr(viewed_track, 'clip_slots') and next_empty_index < len(viewed_track.clip_slots):
                     viewed_clip_slot = viewed_track.clip_slots[next_empty_index]
                     # Highlight the corresponding row in the currently viewed track
-                    if hasattr(self.song.view, 'highlighted_clip_slot'):
-                        self.song.view.highlighted_clip_slot = viewed_clip_slot
-                    logger.info(f"Highlighted variant row {next_empty_index} in viewed track {viewed_track.name}")
+                    if hasattr(song_view, 'highlighted_clip_slot'):
+                        song_view.highlighted_clip_slot = viewed_clip_slot
+                    if _DEBUG:
+                        logger.debug("Highlighted variant row %d in viewed track %s", next_empty_index, viewed_track.name)
 
             # Update the sequencer's target clip if locked
             if self._target_track and hasattr(self._target_track, 'is_locked_to_track') and self._target_track.is_locked_to_track:
@@ -1320,26 +1469,27 @@ class DrumStepSequencerComponent(Component):
                 self._target_track._target_clip = next_empty_slot.clip
                 self._target_track.notify_target_clip()
                 self._on_target_clip_changed()
-                logger.info(f"Updated sequencer target clip to variant in slot {next_empty_index} of locked track {current_track.name}")
+                logger.info("Updated sequencer target clip to variant in slot %d of locked track %s", next_empty_index, current_track.name)
         except Exception as e:
             logger.error(f"Error creating clip variant: {e}")
 
     def _clear_current_clip_notes(self):
         """Clear all notes from the current clip"""
+        song_view = self.song.view
         # Check if sequencer is locked to a track
         if self._target_track and hasattr(self._target_track, 'is_locked_to_track') and self._target_track.is_locked_to_track:
             current_track = self._target_track.target_track
             current_clip = self._target_track.target_clip
         else:
-            if not hasattr(self.song.view, 'selected_track') or not self.song.view.selected_track:
+            if not hasattr(song_view, 'selected_track') or not song_view.selected_track:
                 return
 
-            current_track = self.song.view.selected_track
+            current_track = song_view.selected_track
             current_clip = None
 
-            if hasattr(self.song.view, 'highlighted_clip_slot') and self.song.view.highlighted_clip_slot:
-                if hasattr(self.song.view.highlighted_clip_slot, 'clip'):
-                    current_clip = self.song.view.highlighted_clip_slot.clip
+            if hasattr(song_view, 'highlighted_clip_slot') and song_view.highlighted_clip_slot:
+                if hasattr(song_view.highlighted_clip_slot, 'clip'):
+                    current_clip = song_view.highlighted_clip_slot.clip
 
         if not current_clip:
             return
@@ -1359,12 +1509,53 @@ class DrumStepSequencerComponent(Component):
         """Update the component"""
         super().update()
 
-        # Update composed components
-        self._drum_group.update()
-        self._note_editor.update()
-        if self._loop_selector:
-            self._loop_selector.update()
+        # Update composed components on the next tick, coalescing bursts of updates,
+        # but only if something they depend on changed since the last cascade
+        generation = (self._dirty_generation, self.is_enabled())
+        if generation != self._last_updated_generation:
+            self._last_updated_generation = generation
+            self._schedule_child_updates(self._drum_group, self._note_editor, self._loop_selector)
 
         # Update play button state on component update
         self._update_play_button_state()
 
+    def _schedule_child_updates(self, *children):
+        """Queue children for a single deferred update, however many times update() runs before it"""
+        pending = self._pending_child_updates
+        for child in children:
+            if child is not None and child not in pending:
+                pending.append(child)
+        if not self._update_scheduled:
+            self._update_scheduled = True
+            self._tasks.add(task.run(self._flush_child_updates))
+
+    def _flush_child_updates(self):
+        """Update every queued child component once"""
+        self._update_scheduled = False
+        pending = self._pending_child_updates
+        self._pending_child_updates = []
+        for child in pending:
+            child.update()
+
+    def disconnect(self):
+        """Disconnect the helper objects this component owns and drop their references"""
+        super().disconnect()
+        for owned in (self._sequencer_clip, self._pitch_provider, self._velocity_provider):
+            if owned is not None:
+                owned.disconnect()
+        self._sequencer_clip = None
+        self._pitch_provider = None
+        self._velocity_provider = None
+        self._last_target_track = None
+        self._status_clip = None
+
+
+def _noop_add_note(self, pitch, time):
+    """Stand-in for _add_new_note_in_step when Live does not provide MidiNoteSpecification"""
+    logger.error("MidiNoteSpecification not available - cannot add note")
+
+
+# MidiNoteSpecification availability is fixed at import time, so check it once here
+# instead of on every note add
+if MidiNoteSpecification is None:
+    CustomNoteEditorComponent._add_new_note_in_step = _noop_add_note
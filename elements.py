@@ -1,71 +1,91 @@
 from __future__ import absolute_import, print_function, unicode_literals
-try:
-    from ableton.v3.control_surface import MIDI_NOTE_TYPE, ElementsBase, create_matrix_identifiers
-    from ableton.v3.control_surface.midi import SYSEX_END, SYSEX_START
-except ImportError:
-    from .ableton.v3.control_surface import MIDI_NOTE_TYPE, ElementsBase, create_matrix_identifiers
-    from .ableton.v3.control_surface.midi import SYSEX_END, SYSEX_START
+import logging
+from ._ableton import MIDI_NOTE_TYPE, SYSEX_END, SYSEX_START, ElementsBase, create_matrix_identifiers
+
 from .colors import FULL_BRIGHTNESS_CHANNEL
-from .logger_config import get_logger
+from .logger_config import get_logger, log_init_errors
 
 # Initialize logger for this module
 logger = get_logger('elements')
 
+# Separator line framing the start/end log records
+_BANNER = "=" * 60
+
+# Evaluated once, so every debug site only tests a module constant. False when Python
+# runs optimized (-O / PYTHONOPTIMIZE) or when the logger is not at DEBUG level
+_DEBUG = __debug__ and logger.isEnabledFor(logging.DEBUG)
+
 PAD_MODE_HEADER = (SYSEX_START, 71, 127, 79, 98, 0, 1)
 
+# Note and CC identifiers of the hardware controls, fixed by the device layout
+_CLIP_LAUNCH_IDS = tuple(map(tuple, create_matrix_identifiers(0, 64, width=8, flip_rows=True)))
+_DRUM_PAD_IDS = (
+    (88, 89, 90, 91),
+    (80, 81, 82, 83),
+    (72, 73, 74, 75),
+    (64, 65, 66, 67),
+)
+_CONTROL_PAD_IDS = (
+    (92, 93, 94, 95),
+    (84, 85, 86, 87),
+    (76, 77, 78, 79),
+    (68, 69, 70, 71),
+)
+_SEQUENCE_PAD_IDS = tuple(map(tuple, create_matrix_identifiers(96, 128, width=8, flip_rows=True)))
+_TRACK_BUTTON_IDS = (tuple(range(100, 108)),)
+_SCENE_LAUNCH_IDS = (tuple(range(112, 120)),)
+_FADER_IDS = (tuple(range(48, 56)),)
+
 
 class Elements(ElementsBase):
+    @log_init_errors("Elements")
     def __init__(self, *a, **k):
-        try:
-            logger.info("=" * 60)
-            logger.info("STARTING Elements.__init__")
-            logger.info("=" * 60)
+        logger.info(_BANNER)
+        logger.info("STARTING Elements.__init__")
+        logger.info(_BANNER)
+        if _DEBUG:
             logger.debug("Calling ElementsBase.__init__...")
-            (super().__init__)(*a, **k)
+        (super().__init__)(*a, **k)
+        if _DEBUG:
             logger.debug("✓ ElementsBase.__init__ successful")
 
+        if _DEBUG:
             logger.debug("Adding modifier button: Shift_Button")
-            self.add_modifier_button(122, "Shift_Button", msg_type=MIDI_NOTE_TYPE)
+        self.add_modifier_button(122, "Shift_Button", msg_type=MIDI_NOTE_TYPE)
 
+        if _DEBUG:
             logger.debug("Adding clip launch buttons matrix")
-            self.add_button_matrix(
-                create_matrix_identifiers(0, 64, width=8, flip_rows=True),
-                "Clip_Launch_Buttons",
-                msg_type=MIDI_NOTE_TYPE,
-                led_channel=FULL_BRIGHTNESS_CHANNEL,
-            )
+        self.add_button_matrix(
+            _CLIP_LAUNCH_IDS,
+            "Clip_Launch_Buttons",
+            msg_type=MIDI_NOTE_TYPE,
+            led_channel=FULL_BRIGHTNESS_CHANNEL,
+        )
 
+        if _DEBUG:
             logger.debug("Adding drum pads matrix")
-            self.add_button_matrix(
-                [
-                 [88, 89, 90, 91],
-                 [80, 81, 82, 83],
-                 [72, 73, 74, 75],
-                 [64, 65, 66, 67],
-                ],
-                "Drum_Pads",
-                msg_type=MIDI_NOTE_TYPE,
-                channels=9,
-            )
+        self.add_button_matrix(
+            _DRUM_PAD_IDS,
+            "Drum_Pads",
+            msg_type=MIDI_NOTE_TYPE,
+            channels=9,
+        )
+        if _DEBUG:
             logger.debug("Adding control pads matrix")
-            self.add_button_matrix(
-                [
-                    [92, 93, 94, 95],
-                    [84, 85, 86, 87],
-                    [76, 77, 78, 79],
-                    [68, 69, 70, 71],
-                ],
-                "Control_Pads",
-                msg_type=MIDI_NOTE_TYPE,
-                channels=9,
-            )
+        self.add_button_matrix(
+            _CONTROL_PAD_IDS,
+            "Control_Pads",
+            msg_type=MIDI_NOTE_TYPE,
+            channels=9,
+        )
+        if _DEBUG:
             logger.debug("Adding sequence pads matrix")
-            self.add_button_matrix(
-                create_matrix_identifiers(96, 128, width=8, flip_rows=True),
-                "Sequence_Pads",
-                msg_type=MIDI_NOTE_TYPE,
-                channels=9,
-            )
+        self.add_button_matrix(
+            _SEQUENCE_PAD_IDS,
+            "Sequence_Pads",
+            msg_type=MIDI_NOTE_TYPE,
+            channels=9,
+        )
         # logger.debug("Adding sequence pages matrix")
         # self.add_button_matrix(
         #     [
@@ -77,39 +97,42 @@ class Elements(ElementsBase):
         #     channels=9,
         # )
 
+        if _DEBUG:
             logger.debug("Adding track buttons matrix")
-            self.add_button_matrix([range(100, 108)], "Track_Buttons", msg_type=MIDI_NOTE_TYPE)
+        self.add_button_matrix(_TRACK_BUTTON_IDS, "Track_Buttons", msg_type=MIDI_NOTE_TYPE)
 
+        if _DEBUG:
             logger.debug("Adding scene launch buttons matrix")
-            self.add_button_matrix([range(112, 120)], "Scene_Launch_Buttons", msg_type=MIDI_NOTE_TYPE)
+        self.add_button_matrix(_SCENE_LAUNCH_IDS, "Scene_Launch_Buttons", msg_type=MIDI_NOTE_TYPE)
 
+        if _DEBUG:
             logger.debug("Adding master fader encoder")
-            self.add_encoder(56, "Master_Fader")
+        self.add_encoder(56, "Master_Fader")
 
+        if _DEBUG:
             logger.debug("Adding faders encoder matrix")
-            self.add_encoder_matrix([range(48, 56)], "Faders")
+        self.add_encoder_matrix(_FADER_IDS, "Faders")
+
+        # Reusable pad mode message; only the value byte changes between sends
+        pad_mode_buffer = bytearray(PAD_MODE_HEADER + (0, SYSEX_END))
+        pad_mode_value_index = len(PAD_MODE_HEADER)
 
-            def pad_mode_message_generator(v):
-                """Generate pad mode SYSEX message and log the value"""
-                message = PAD_MODE_HEADER + (v, SYSEX_END)
-                logger.debug(f"Sending pad mode SYSEX message with value: {v}")
-                return message
+        def pad_mode_message_generator(v):
+            """Generate pad mode SYSEX message, logging the value only when debugging"""
+            if _DEBUG:
+                logger.debug("Sending pad mode SYSEX message with value: %s", v)
+            pad_mode_buffer[pad_mode_value_index] = v
+            return tuple(pad_mode_buffer)
 
+        if _DEBUG:
             logger.debug("Adding pad mode control sysex element")
-            self.add_sysex_element(
-                PAD_MODE_HEADER,
-                "Pad_Mode_Control",
-                pad_mode_message_generator,
-                use_first_byte_as_value=True,
-            )
-
-            logger.info("=" * 60)
-            logger.info("✓✓✓ Elements INITIALIZED SUCCESSFULLY ✓✓✓")
-            logger.info("=" * 60)
-        except Exception as e:
-            logger.error("=" * 60)
-            logger.error("✗✗✗ Elements INITIALIZATION FAILED ✗✗✗")
-            logger.error(f"Error: {e}")
-            logger.error("=" * 60)
-            logger.error("Full traceback:", exc_info=True)
-            raise
+        self.add_sysex_element(
+            PAD_MODE_HEADER,
+            "Pad_Mode_Control",
+            pad_mode_message_generator,
+            use_first_byte_as_value=True,
+        )
+
+        logger.info(_BANNER)
+        logger.info("✓✓✓ Elements INITIALIZED SUCCESSFULLY ✓✓✓")
+        logger.info(_BANNER)
@@ -1,54 +1,110 @@
+import atexit
+import functools
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# Size at which the log file is rotated, and how many old files are kept
+LOG_MAX_BYTES = 2_000_000
+LOG_BACKUP_COUNT = 3
+
+# Child loggers already handed out by get_logger, by name
+_LOGGER_CACHE = {}
+
+# Background listener that formats and writes records off Live's main thread
+queue_listener = None
+
+
+def _stop_queue_listener():
+    """Stop the background listener, draining queued records and flushing its handlers"""
+    global queue_listener
+    if queue_listener is None:
+        return
+    queue_listener.stop()
+    for handler in queue_listener.handlers:
+        handler.close()
+    queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
 
 def setup_logging():
     """
     Setup logging configuration for the APC mini mk2 custom script.
-    Logs are written to the Desktop folder with timestamp-based filenames.
+    Logs are appended to logs/apc_mini_mk2_custom.log next to this file, rotated by size.
+    Only the first call configures handlers; Live reloading the script returns the
+    already configured logger instead of reopening the log file.
     """
+    logger = logging.getLogger('apc_mini_mk2_custom')
+    if getattr(logger, '_apc_configured', False):
+        return logger
+
     # Get the this file's folder + logs folder
     logs_folder_path = os.path.join(os.path.dirname(__file__), "logs")
 
-    # Create log filename with timestamp
     log_filename = "apc_mini_mk2_custom.log"
     log_filepath = os.path.join(logs_folder_path, log_filename)
 
-    # Create logger
-    logger = logging.getLogger('apc_mini_mk2_custom')
-    logger.setLevel(logging.DEBUG)
-
-    # Remove any existing handlers to avoid duplicates
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
+    # Create logger - DEBUG records are only produced when APC_MINI_DEBUG=1
+    debug_enabled = os.environ.get('APC_MINI_DEBUG') == '1'
+    logger.setLevel(logging.DEBUG if debug_enabled else logging.INFO)
 
-    # Create file handler
-    file_handler = logging.FileHandler(log_filepath, mode='w', encoding='utf-8')
+    # Create file handler, appending across reloads and rotating to bound disk usage
+    file_handler = RotatingFileHandler(
+        log_filepath, mode='a', maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+    )
     file_handler.setLevel(logging.DEBUG)
 
-    # Create console handler for real-time debugging
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)  # Only show INFO and above in console
-
     # Create formatter
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s',
         datefmt='%H:%M:%S'
     )
 
-    # Add formatter to handlers
+    # File writes already happen on the queue listener thread, so records go straight
+    # to the file instead of sitting in a buffer until an error flushes it
     file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
+    handlers = [file_handler]
+
+    # Console handler for real-time debugging, opt-in with APC_MINI_CONSOLE_LOG=1.
+    # Off by default since stderr writes block Live's main thread
+    if os.environ.get('APC_MINI_CONSOLE_LOG') == '1':
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)  # Only show INFO and above in console
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
 
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # The logger only enqueues records; the listener thread runs the handlers
+    global queue_listener
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    queue_listener.start()
+    logger._apc_configured = True
 
     # Log initial setup
-    logger.info(f"Logging initialized. Log file: {log_filepath}")
+    logger.info("Logging initialized. Log file: %s", log_filepath)
     logger.info("APC mini mk2 custom MIDI Remote Script starting...")
 
     return logger
 
+def log_init_errors(name):
+    """
+    Decorator for setup functions: logs a failure once, with its traceback, and re-raises.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*a, **k):
+            try:
+                return fn(*a, **k)
+            except Exception:
+                get_logger().exception("%s initialization failed", name)
+                raise
+        return wrapper
+    return decorator
+
 def get_logger(name=None):
     """
     Get a logger instance for the given name.
@@ -56,7 +112,11 @@ def get_logger(name=None):
     """
     if name is None:
         return logging.getLogger('apc_mini_mk2_custom')
-    return logging.getLogger(f'apc_mini_mk2_custom.{name}')
+    logger = _LOGGER_CACHE.get(name)
+    if logger is None:
+        logger = logging.getLogger('apc_mini_mk2_custom.' + name)
+        _LOGGER_CACHE[name] = logger
+    return logger
 
 # Initialize logging when this module is imported
 main_logger = setup_logging()